@@ -9,68 +9,129 @@ H labels   (only 5 midpoint labels, e.g., '49%', blank elsewhere)
 Usage: run, enter five midpoint (x,y) pairs and points-per-segment.
 """
 
-from dataclasses import dataclass
-from typing import List, Tuple
 import numpy as np
 import pandas as pd
+import xlsxwriter
+
+try:
+    import numba
+except ImportError:  # optional; pure-NumPy sampling is used without it
+    numba = None
 
 # ---------- Spline helpers (Excel-like 'Smoothed line') ----------
 
-@dataclass
-class Pt:
-    x: float
-    y: float
+# Maps a [P0, P1, P2, P3] Catmull–Rom window to [P1, C1, C2, P2]
+_CR_TO_BEZIER = np.array([[0.0,    1.0, 0.0,    0.0],
+                          [-1/6.0, 1.0, 1/6.0,  0.0],
+                          [0.0,    1/6.0, 1.0, -1/6.0],
+                          [0.0,    0.0, 1.0,    0.0]])
+
+def catmull_rom_to_bezier(points: np.ndarray) -> np.ndarray:
+    """Open Catmull–Rom (tension=0) → (S, 4, 2) cubic Bezier control points.
 
-def catmull_rom_to_bezier(points: List[Pt]) -> List[Tuple[Pt, Pt, Pt, Pt]]:
-    """Open Catmull–Rom (tension=0) → list of cubic Bezier segments."""
-    n = len(points)
-    if n < 2:
+    ``points`` is an (N, 2) array of (x, y) rows, ascending by x.
+    """
+    P = np.asarray(points, dtype=float)
+    if len(P) < 2:
         raise ValueError("Need at least two points")
 
     # Extend endpoints by mirroring to mimic Excel's smoothed line
-    ext = [None] * (n + 2)
-    ext[1:-1] = points[:]
-    ext[0]  = Pt(points[0].x - (points[1].x - points[0].x),
-                 points[0].y - (points[1].y - points[0].y))
-    ext[-1] = Pt(points[-1].x + (points[-1].x - points[-2].x),
-                 points[-1].y + (points[-1].y - points[-2].y))
-
-    segs: List[Tuple[Pt, Pt, Pt, Pt]] = []
-    for i in range(1, n):
-        P0, P1, P2, P3 = ext[i-1], ext[i], ext[i+1], ext[i+2]
-        C1 = Pt(P1.x + (P2.x - P0.x)/6.0, P1.y + (P2.y - P0.y)/6.0)
-        C2 = Pt(P2.x - (P3.x - P1.x)/6.0, P2.y - (P3.y - P1.y)/6.0)
-        segs.append((P1, C1, C2, P2))
-    return segs
-
-def sample_bezier(P1: Pt, C1: Pt, C2: Pt, P2: Pt, n_pts: int):
-    """Sample one cubic Bezier at n_pts (including ends)."""
-    t = np.linspace(0.0, 1.0, n_pts)
-    b0 = (1 - t) ** 3
-    b1 = 3 * (1 - t) ** 2 * t
-    b2 = 3 * (1 - t) * t ** 2
-    b3 = t ** 3
-    xs = b0 * P1.x + b1 * C1.x + b2 * C2.x + b3 * P2.x
-    ys = b0 * P1.y + b1 * C1.y + b2 * C2.y + b3 * P2.y
-    return xs, ys
+    ext = np.vstack([2 * P[0] - P[1], P, 2 * P[-1] - P[-2]])
+    # All (S, 4, 2) sliding windows at once, then one matrix multiply
+    W = np.lib.stride_tricks.sliding_window_view(ext, (4, 2)).reshape(-1, 4, 2)
+    return _CR_TO_BEZIER @ W
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _de_casteljau_batch(ctrl, ts, out):
+        """Evaluate (S, deg+1) Bezier segments at ts into out (S, len(ts)).
+
+        Works for any degree, unlike the hardcoded cubic formula, and runs
+        fully in registers — no temporary basis arrays.
+        """
+        for s in numba.prange(ctrl.shape[0]):
+            for j in range(ts.size):
+                b = ctrl[s].copy()
+                t = ts[j]
+                for k in range(b.size - 1, 0, -1):
+                    for i in range(k):
+                        b[i] = (1 - t) * b[i] + t * b[i + 1]
+                out[s, j] = b[0]
+
+
+def sample_bezier(ctrl: np.ndarray, t: np.ndarray):
+    """Sample all cubic Bezier segments at the shared parameter values ``t``.
+
+    ``ctrl`` is the (S, 4, 2) control-point array from
+    catmull_rom_to_bezier; ``t`` spans [0, 1] including both ends and is
+    built once by the caller, so nothing is recomputed per segment.
+
+    Evaluates every segment in one broadcast against a shared t-vector
+    instead of looping segment-by-segment, then drops the duplicated
+    join points so the result is a single continuous polyline.
+
+    With numba installed, evaluation goes through a compiled De Casteljau
+    kernel that handles any degree. Otherwise each cubic is converted from
+    Bernstein to monomial form (a + b*t + c*t^2 + d*t^3) and sampled with
+    a Horner evaluation — three fused multiply-adds per coordinate instead
+    of four pow calls and eight multiplies.
+    """
+    P = ctrl
+    n_pts = t.size
+    if numba is not None:
+        xy = np.empty((len(P), n_pts, 2))
+        _de_casteljau_batch(np.ascontiguousarray(P[:, :, 0]), t, xy[:, :, 0])
+        _de_casteljau_batch(np.ascontiguousarray(P[:, :, 1]), t, xy[:, :, 1])
+    else:
+        # Bernstein → monomial coefficients, each (S, 1, 2) for broadcasting
+        a, b, c, d = (P[:, :1],
+                      3 * (P[:, 1:2] - P[:, :1]),
+                      3 * (P[:, :1] - 2 * P[:, 1:2] + P[:, 2:3]),
+                      -P[:, :1] + 3 * P[:, 1:2] - 3 * P[:, 2:3] + P[:, 3:4])
+        tc = t[:, None]
+        xy = ((d * tc + c) * tc + b) * tc + a  # Horner's rule, (S, n_pts, 2)
+    # Each segment's first sample repeats the previous segment's last one;
+    # copy straight into a preallocated buffer of the known final size
+    total = (n_pts - 1) * len(P) + 1
+    out = np.empty((total, 2))
+    out[0] = xy[0, 0]
+    out[1:].reshape(len(P), n_pts - 1, 2)[:] = xy[:, 1:]
+    # Monomial (and fastmath) evaluation can drift the t=1 samples by ~1 ulp
+    # off the Bernstein endpoints; pin the joins to the exact control points
+    # so exact-equality checks against band edges downstream still hit
+    out[0] = P[0, 0]
+    out[np.arange(1, len(P) + 1) * (n_pts - 1)] = P[:, 3]
+    return out[:, 0], out[:, 1]
 
 # ---------- Main ----------
 
 def main():
     print("\nOVP curve generator (single-sheet output)")
     print("Enter FIVE midpoint (x, y) pairs, ascending by x (e.g., 2.5 0.04)")
-
-    mids: List[Pt] = []
-    for i in range(5):
-        while True:
+    print("Either all five on one line separated by ';', or one per line")
+
+    # Fast path: one line with all five pairs, parsed in a single call
+    raw = input("Point 1 (x y), or all five pairs: ").strip()
+    try:
+        arr = np.fromstring(raw.replace(";", " ").replace(",", " "), sep=" ")
+    except ValueError:
+        arr = np.empty(0)  # non-numeric input drops into the per-line loop
+    if arr.size == 10:
+        mids = arr.reshape(5, 2)
+    else:
+        # Fall back to one pair per line, keeping anything already parsed
+        mids_list = [(arr[0], arr[1])] if arr.size == 2 else []
+        if not mids_list:
+            print("  Please enter two numbers like: 3.5 0.49")
+        while len(mids_list) < 5:
             try:
-                sx, sy = input(f"Point {i+1} (x y): ").strip().split()
-                mids.append(Pt(float(sx), float(sy)))
-                break
+                prompt = f"Point {len(mids_list)+1} (x y): "
+                sx, sy = input(prompt).strip().split()
+                mids_list.append((float(sx), float(sy)))
             except Exception:
                 print("  Please enter two numbers like: 3.5 0.49")
-
-    mids.sort(key=lambda p: p.x)
+        mids = np.asarray(mids_list)
+    mids = mids[mids[:, 0].argsort()]
 
     while True:
         try:
@@ -83,43 +144,63 @@ def main():
 
     # Build Excel-like smoothed curve through midpoints
     beziers = catmull_rom_to_bezier(mids)
-    xs_all, ys_all = [], []
-    for idx, (P1, C1, C2, P2) in enumerate(beziers):
-        xs, ys = sample_bezier(P1, C1, C2, P2, n_per_seg)
-        if idx > 0:
-            xs, ys = xs[1:], ys[1:]  # avoid double-counting the join point
-        xs_all.extend(xs)
-        ys_all.extend(ys)
+    t = np.linspace(0.0, 1.0, n_per_seg)
+    xs_arr, ys_arr = sample_bezier(beziers, t)
+    n = xs_arr.size
 
-    df = pd.DataFrame({"x": xs_all, "y": ys_all})
+    # Columns A..H, carried as a plain dict of arrays in output order —
+    # no DataFrame consolidation or index alignment on the way to Excel
+    cols = {"x": xs_arr, "y": ys_arr}
 
     # Define band edges (edit here if you ever change bins)
-    bands = [(2.0, 3.0, "2–3"),
-             (3.0, 4.0, "3–4"),
-             (4.0, 5.0, "4–5"),
-             (5.0, 6.0, "5–6"),
-             (6.0, 7.0, "6–7")]
-
-    # Create columns C–G for bands: values only inside range, else blank (NaN)
-    for i, (lo, hi, label) in enumerate(bands):
-        # last band inclusive of hi
-        mask = (df["x"] >= lo) & (df["x"] <= (hi if i == len(bands)-1 else hi - 1e-12))
-        df[label] = np.where(mask, df["y"], np.nan)
+    edges = np.array([2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    band_names = ["2–3", "3–4", "4–5", "5–6", "6–7"]
+
+    # Columns C–G for bands: values only inside range, else blank (NaN).
+    # pd.cut assigns each row a band in one categorical pass; y is scattered
+    # into a single (N, 5) buffer via the small-int codes.
+    cat = pd.cut(xs_arr, edges, labels=band_names, right=False)
+    bin_idx = np.array(cat.codes)  # -1 for out-of-range rows
+    bin_idx[xs_arr == edges[-1]] = len(band_names) - 1  # last band inclusive
+    valid = bin_idx >= 0
+    out = np.full((n, len(band_names)), np.nan)
+    out[valid, bin_idx[valid]] = ys_arr[valid]
+    for i, name in enumerate(band_names):
+        cols[name] = out[:, i]  # views of the one buffer, no per-band copy
 
     # Column H 'labels': only five midpoint labels (e.g., "49%")
-    labels = [""] * len(df)
-    for pt in mids:
-        # locate nearest dense x to the midpoint x
-        idx = int((df["x"] - pt.x).abs().idxmin())
-        labels[idx] = f"{pt.y*100:.0f}%"
-    df["labels"] = labels
-
-    # Reorder columns: A..H
-    out_df = df[["x", "y", "2–3", "3–4", "4–5", "5–6", "6–7", "labels"]]
-
+    # Locate nearest dense x per midpoint: the grid is sorted, so a binary
+    # search beats a full |x - mx| scan per label
+    mids_x = mids[:, 0]
+    pos = np.searchsorted(xs_arr, mids_x)
+    left = np.clip(pos - 1, 0, len(xs_arr) - 1)
+    right = np.clip(pos, 0, len(xs_arr) - 1)
+    labels_idx = np.where(np.abs(xs_arr[right] - mids_x)
+                          < np.abs(xs_arr[left] - mids_x), right, left)
+
+    # Format the five label strings once; the loop below only writes indexes
+    label_strs = [f"{y*100:.0f}%" for y in mids[:, 1]]
+    labels = [""] * n
+    for idx, s in zip(labels_idx, label_strs):
+        labels[int(idx)] = s
+    cols["labels"] = labels
+
+    # No formatting needed here, so write each column (A..H) straight from
+    # the arrays we already hold — no DataFrame round-trip per cell
     out_file = "Company Job Titles - ovp_curve.xlsx"
-    with pd.ExcelWriter(out_file, engine="xlsxwriter") as w:
-        out_df.to_excel(w, sheet_name="curve_data", index=False)
+    wb = xlsxwriter.Workbook(out_file)
+    ws = wb.add_worksheet("curve_data")
+    ws.write_row(0, 0, list(cols))
+    for j, col in enumerate(cols.values()):
+        if isinstance(col, np.ndarray):
+            nan = np.isnan(col)
+            if nan.any():
+                col = col.astype(object)
+                col[nan] = None  # blank cells outside the band
+            else:
+                col = col.tolist()
+        ws.write_column(1, j, col)
+    wb.close()
 
     print(f"\nSaved: {out_file}\n"
           "In Excel:\n"
@@ -19,25 +19,33 @@ def main():
             break
         print("  ❌ Not found or not an .xlsx file. Try again.")
 
-    # 2) Read first sheet
+    # 2) Read only the two needed columns from the first sheet; prefer the
+    # Rust-backed calamine engine when python-calamine is installed. The
+    # openpyxl fallback streams too — pandas opens it in read_only mode —
+    # so neither path loads the whole workbook DOM.
+    required = ["Average OVP", "Headcount"]
     try:
-        df = pd.read_excel(path)
+        try:
+            df = pd.read_excel(path, sheet_name=0, usecols=required,
+                               engine="calamine")
+        except ImportError:
+            df = pd.read_excel(path, sheet_name=0, usecols=required)
+    except ValueError:
+        # usecols rejected: report which required column(s) are absent
+        found = list(pd.read_excel(path, nrows=0).columns)
+        missing = set(required) - set(found)
+        print(f"  ❌ Missing required column(s): {', '.join(sorted(missing))}")
+        print(f"  Columns found: {found}")
+        sys.exit(1)
     except Exception as e:
         print(f"  ❌ Failed to read Excel: {e}")
         sys.exit(1)
 
-    # 3) Validate required columns
-    required = {"Average OVP", "Headcount"}
-    missing = required - set(df.columns)
-    if missing:
-        print(f"  ❌ Missing required column(s): {', '.join(sorted(missing))}")
-        print(f"  Columns found: {list(df.columns)}")
-        sys.exit(1)
-
-    # 4) Clean/coerce
-    work = df[["Average OVP", "Headcount"]].copy()
-    work["Average OVP"] = pd.to_numeric(work["Average OVP"], errors="coerce")
-    work["Headcount"]   = pd.to_numeric(work["Headcount"], errors="coerce")
+    # 3) Clean/coerce (only non-numeric columns still need coercion)
+    work = df
+    for col in required:
+        if not pd.api.types.is_numeric_dtype(work[col]):
+            work[col] = pd.to_numeric(work[col], errors="coerce")
     work = work.dropna(subset=["Average OVP", "Headcount"])
     work = work[work["Headcount"] > 0]
 
@@ -45,40 +53,34 @@ def main():
         print("  ❌ No valid rows after cleaning (check data).")
         sys.exit(1)
 
-    # 5) Define bins explicitly and compute with boolean masks
-    edges = [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
-    bins = [(edges[i], edges[i+1]) for i in range(len(edges)-1)]
-
-    results = []
-    total_hc = 0
-    # First pass to get total_hc in-range (so % excludes out-of-range)
-    for i, (lo, hi) in enumerate(bins):
-        if i < len(bins)-1:
-            mask = (work["Average OVP"] >= lo) & (work["Average OVP"] < hi)
-        else:
-            mask = (work["Average OVP"] >= lo) & (work["Average OVP"] <= hi)
-        hc_sum = float(work.loc[mask, "Headcount"].sum())
-        total_hc += hc_sum
-        results.append((lo, hi, hc_sum))
+    # 4) Define bins explicitly and sum all five headcounts in one pass
+    edges = np.array([2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    # OVP values live in 2–7, so float32 is plenty for the binning scan and
+    # halves its memory traffic; headcounts stay float64 for accumulation
+    ovp = work["Average OVP"].to_numpy(dtype=np.float32)
+    hc = work["Headcount"].to_numpy(dtype=float)
 
-    # Build output rows with shares and midpoints
-    rows = []
-    for (lo, hi, hc_sum) in results:
-        share = (hc_sum / total_hc) if total_hc > 0 else 0.0
-        midpoint = (lo + hi) / 2.0
-        label = f"{int(lo)}–{int(hi)}"
-        rows.append({
-            "Bin Lower": lo,
-            "Bin Upper": hi,
-            "Midpoint": midpoint,
-            "Range Label": label,
-            "Headcount": hc_sum,
-            "Share of Total (%)": share
-        })
+    bin_labels = [f"{int(lo)}–{int(hi)}" for lo, hi in zip(edges[:-1], edges[1:])]
+    # One categorical pass bins every row, then the per-bin sums come out of
+    # a single C-level groupby; out-of-range rows fall out as NaN bins.
+    # Bins are half-open [lo, hi) with the top edge pulled into the last bin.
+    bins = pd.cut(ovp, edges, labels=bin_labels, right=False)
+    bins[ovp == edges[-1]] = bin_labels[-1]
+    hc_sums = pd.Series(hc).groupby(bins, observed=False).sum().to_numpy()
+    total_hc = float(hc_sums.sum())
 
-    out_df = pd.DataFrame(rows)
+    # Build the output table from the bin vectors — no per-row loop
+    shares = hc_sums / total_hc if total_hc > 0 else np.zeros_like(hc_sums)
+    out_df = pd.DataFrame({
+        "Bin Lower": edges[:-1],
+        "Bin Upper": edges[1:],
+        "Midpoint": (edges[:-1] + edges[1:]) / 2.0,
+        "Range Label": bin_labels,
+        "Headcount": hc_sums,
+        "Share of Total (%)": shares,
+    })
 
-    # 6) Write output
+    # 5) Write output
     out_file = "Company Job Titles - ovp_histogram.xlsx"
     with pd.ExcelWriter(out_file, engine="xlsxwriter") as w:
         out_df.to_excel(w, sheet_name="ovp_histogram", index=False)